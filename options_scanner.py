@@ -1,10 +1,100 @@
 import os
+import threading
+import warnings
 import requests
+import orjson
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import yfinance as yf
-from datetime import datetime
+from cachetools import TTLCache, cached
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from curl_cffi.requests.exceptions import RequestException as CurlRequestException
+from datetime import date, datetime
+from numba import njit
+from requests.adapters import HTTPAdapter
 from typing import Literal
+from yfinance.exceptions import YFException
+
+# Number of expiration dates fetched concurrently from Yahoo Finance
+YFINANCE_MAX_WORKERS = 8
+# Overall deadline in seconds for the option chain requests of all expiration
+# dates of a ticker; dates still pending when it passes are skipped
+YFINANCE_FETCH_DEADLINE = 120
+
+ALPHAVANTAGE_URL = "https://www.alphavantage.co/query"
+# Seconds to wait for an Alpha Vantage API response
+ALPHAVANTAGE_REQUEST_TIMEOUT = 30
+# Fields read from each contract of an Alpha Vantage HISTORICAL_OPTIONS response
+ALPHAVANTAGE_CONTRACT_SCHEMA = pa.schema([
+    ('contractID', pa.string()),
+    ('type', pa.string()),
+    ('strike', pa.string()),
+    ('expiration', pa.string()),
+    ('volume', pa.string()),
+    ('open_interest', pa.string()),
+    ('implied_volatility', pa.string()),
+    ('bid', pa.string()),
+    ('ask', pa.string())
+])
+
+# HTTP session reused across API requests so connections are kept alive
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_SESSION.headers.update({'Accept-Encoding': 'gzip'})
+
+# Errors raised by yfinance when a Yahoo Finance request fails; yfinance sends
+# its requests through curl_cffi, whose exceptions don't derive from requests'
+YFINANCE_ERRORS = (YFException, CurlRequestException, requests.exceptions.RequestException)
+
+# Seconds a yfinance Ticker, with its list of expiration dates, or an option
+# chain fetched from Yahoo Finance is reused before refetching
+YFINANCE_CACHE_TTL = 60
+
+# Columns shared by the options chain DataFrames of every data source
+OPTIONS_CHAIN_COLUMNS = ['contract_id', 'type', 'strike', 'expiration', 'volume',
+                         'open_interest', 'implied_volatility', 'bid', 'ask']
+
+# Dtypes of the options chain string columns
+OPTIONS_CHAIN_DTYPES = {
+    'contract_id': 'string[pyarrow]',
+    'type': pd.CategoricalDtype(['call', 'put']),
+    'expiration': 'string[pyarrow]'
+}
+
+# Dtypes of the options chain numeric columns, used where no source data sets them
+OPTIONS_CHAIN_NUMERIC_DTYPES = {
+    'strike': 'float64',
+    'volume': 'int64',
+    'open_interest': 'int64',
+    'implied_volatility': 'float64',
+    'bid': 'float64',
+    'ask': 'float64'
+}
+
+# Dtype of the aggregate options chain source column
+SOURCE_DTYPE = pd.CategoricalDtype(['yfinance', 'alphavantage'])
+
+@cached(cache=TTLCache(maxsize=256, ttl=YFINANCE_CACHE_TTL), lock=threading.Lock())
+def _ticker(symbol: str) -> yf.Ticker:
+    """
+    Get the yfinance Ticker for a symbol, reusing it for YFINANCE_CACHE_TTL
+    seconds. A Ticker fetches its expiration dates only once, so it is
+    replaced after that to pick up new expirations and drop expired ones.
+    """
+    return yf.Ticker(symbol)
+
+@cached(cache=TTLCache(maxsize=1024, ttl=YFINANCE_CACHE_TTL), lock=threading.Lock())
+def _option_chain(symbol: str, expiration_date: str):
+    """
+    Get the yfinance options chain of a symbol for one expiration date, reusing
+    results fetched within the last YFINANCE_CACHE_TTL seconds.
+    
+    The calls and puts DataFrames of a cached result are shared between
+    callers, so read from them without modifying them in place.
+    """
+    return _ticker(symbol).option_chain(expiration_date)
 
 def get_option_price(
     exchange: str,
@@ -29,7 +119,7 @@ def get_option_price(
     Raises:
         ValueError: If contract_type is not "call" or "put"
         ValueError: If expiration_date is invalid or in the past
-        ValueError: If ticker is not found
+        ValueError: If ticker is not found or if there's an error fetching option data
     """
     # Validate contract type
     if contract_type.lower() not in ["call", "put"]:
@@ -37,33 +127,34 @@ def get_option_price(
     
     # Validate expiration date
     try:
-        exp_date = datetime.strptime(expiration_date, "%Y-%m-%d")
-        if exp_date < datetime.now():
-            raise ValueError("Expiration date cannot be in the past")
+        exp_date = date.fromisoformat(expiration_date)
     except ValueError as e:
         raise ValueError(f"Invalid expiration date format. Use YYYY-MM-DD. Error: {str(e)}")
+    # fromisoformat also accepts other ISO 8601 forms such as 20300117
+    if exp_date.isoformat() != expiration_date:
+        raise ValueError(f"Invalid expiration date format. Use YYYY-MM-DD. Got: {expiration_date}")
+    if exp_date < date.today():
+        raise ValueError("Expiration date cannot be in the past")
     
-    # Get option data using yfinance
-    stock = yf.Ticker(ticker)
-    
+    # Get all options chain for the expiration date
     try:
-        # Get all options chain for the expiration date
-        options = stock.option_chain(expiration_date)
-        
-        # Select calls or puts based on contract_type
-        chain = options.calls if contract_type.lower() == "call" else options.puts
-        
-        # Find the contract with matching strike price
-        contract = chain[chain['strike'] == strike_price]
-        
-        if contract.empty:
-            raise ValueError(f"No {contract_type} contract found for strike price {strike_price}")
-        
-        # Return the last traded price
-        return float(contract['lastPrice'].iloc[0])
-        
-    except Exception as e:
+        options = _option_chain(ticker, expiration_date)
+    except YFINANCE_ERRORS as e:
         raise ValueError(f"Error fetching option data: {str(e)}")
+    
+    # Select calls or puts based on contract_type
+    chain = options.calls if contract_type.lower() == "call" else options.puts
+    if chain is None:
+        raise ValueError(f"No {contract_type} options data for {ticker} expiring {expiration_date}")
+    
+    # Find the contract with matching strike price
+    contract = chain[chain['strike'] == strike_price]
+    
+    if contract.empty:
+        raise ValueError(f"No {contract_type} contract found for strike price {strike_price}")
+    
+    # Return the last traded price
+    return float(contract['lastPrice'].iloc[0])
 
 def get_options_chain_from_yfinance(exchange: str, ticker: str) -> pd.DataFrame:
     """
@@ -74,7 +165,7 @@ def get_options_chain_from_yfinance(exchange: str, ticker: str) -> pd.DataFrame:
         ticker (str): Exchange ticker symbol of the underlying asset
         
     Returns:
-        pd.DataFrame: DataFrame containing options data with columns:
+        pd.DataFrame: DataFrame sorted by contract_id containing options data with columns:
             - contract_id: str, unique identifier for the option contract
             - type: str, option type ('call' or 'put')
             - strike: float, strike price of the contract
@@ -88,62 +179,132 @@ def get_options_chain_from_yfinance(exchange: str, ticker: str) -> pd.DataFrame:
     Raises:
         ValueError: If ticker is not found or if there's an error fetching options data
     """
+    # Get stock data using yfinance
+    stock = _ticker(ticker)
+    
+    # Get all available expiration dates
     try:
-        # Get stock data using yfinance
-        stock = yf.Ticker(ticker)
-        
-        # Get all available expiration dates
         expiration_dates = stock.options
-        
-        if not expiration_dates:
-            raise ValueError(f"No options available for {ticker}")
-        
-        # Initialize list to store all options data
-        all_options = []
-        
-        # Fetch options data for each expiration date
-        for date in expiration_dates:
-            try:
-                # Get options chain for this expiration
-                options = stock.option_chain(date)
-                
-                # Process calls
-                calls_df = options.calls.copy()
-                calls_df['type'] = 'call'
-                calls_df['expiration'] = date
-                
-                # Process puts
-                puts_df = options.puts.copy()
-                puts_df['type'] = 'put'
-                puts_df['expiration'] = date
-                
-                # Select and rename columns for both
-                columns = {
-                    'contractSymbol': 'contract_id',
-                    'openInterest': 'open_interest',
-                    'impliedVolatility': 'implied_volatility'
-                }
-                
-                for df in [calls_df, puts_df]:
-                    df.rename(columns=columns, inplace=True)
-                    selected_df = df[['contract_id', 'type', 'strike', 'expiration', 
-                                    'volume', 'open_interest', 'implied_volatility', 
-                                    'bid', 'ask']]
-                    all_options.append(selected_df)
-                
-            except Exception as e:
-                continue
-        
-        if not all_options:
-            raise ValueError(f"Failed to fetch any valid options data for {ticker}")
-            
-        # Concatenate all options into a single DataFrame
-        options_chain = pd.concat(all_options, ignore_index=True)
-        
-        return options_chain
-        
-    except Exception as e:
+    except YFINANCE_ERRORS as e:
         raise ValueError(f"Error fetching options chain: {str(e)}")
+    
+    if not expiration_dates:
+        raise ValueError(f"No options available for {ticker}")
+    
+    # yfinance column backing each options chain column
+    source_columns = {
+        'contract_id': 'contractSymbol',
+        'strike': 'strike',
+        'volume': 'volume',
+        'open_interest': 'openInterest',
+        'implied_volatility': 'impliedVolatility',
+        'bid': 'bid',
+        'ask': 'ask'
+    }
+    
+    # Fetch the options chain for every expiration date concurrently and read
+    # the raw column arrays of its calls and puts tables, keyed by date so the
+    # results can be assembled in expiration order
+    chains = {}
+    executor = ThreadPoolExecutor(max_workers=YFINANCE_MAX_WORKERS)
+    try:
+        futures = {
+            executor.submit(_option_chain, ticker, expiration_date): expiration_date
+            for expiration_date in expiration_dates
+        }
+        try:
+            for future in as_completed(futures, timeout=YFINANCE_FETCH_DEADLINE):
+                expiration_date = futures[future]
+                try:
+                    options = future.result()
+                except (*YFINANCE_ERRORS, KeyError, ValueError) as e:
+                    warnings.warn(f"Skipping {ticker} options expiring {expiration_date}: {str(e)}")
+                    continue
+                # yfinance returns no tables when Yahoo has no options for the date
+                if options.calls is None or options.puts is None:
+                    warnings.warn(f"Skipping {ticker} options expiring {expiration_date}: no options data returned")
+                    continue
+                try:
+                    chains[expiration_date] = [
+                        (contract_type, len(df),
+                         {column: df[source_column].to_numpy() for column, source_column in source_columns.items()})
+                        for contract_type, df in (('call', options.calls), ('put', options.puts))
+                    ]
+                except KeyError as e:
+                    warnings.warn(f"Skipping {ticker} options expiring {expiration_date}: missing column {str(e)}")
+        except FuturesTimeoutError:
+            pending = sorted(d for future, d in futures.items() if not future.done())
+            warnings.warn(f"Timed out fetching {ticker} options expiring {', '.join(pending)}")
+    finally:
+        # Don't let a hung request block the caller once the deadline has passed
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    if not chains:
+        raise ValueError(f"Failed to fetch any valid options data for {ticker}")
+    
+    # Gather the column arrays of every calls and puts table, then build the
+    # DataFrame once instead of concatenating per-date frames
+    arrays = {column: [] for column in source_columns}
+    table_types = []
+    table_dates = []
+    table_lengths = []
+    for expiration_date in expiration_dates:
+        if expiration_date not in chains:
+            continue
+        
+        for contract_type, length, table_arrays in chains[expiration_date]:
+            for column in source_columns:
+                arrays[column].append(table_arrays[column])
+            table_types.append(contract_type)
+            table_dates.append(expiration_date)
+            table_lengths.append(length)
+    
+    # The type and expiration of a table are constant, so expand them
+    # with a single repeat each rather than building per-table arrays
+    columns = {column: np.concatenate(arrays[column]) for column in source_columns}
+    type_dtype = OPTIONS_CHAIN_DTYPES['type']
+    type_codes = type_dtype.categories.get_indexer(table_types)
+    columns['type'] = pd.Categorical.from_codes(np.repeat(type_codes, table_lengths), dtype=type_dtype)
+    columns['expiration'] = np.repeat(np.array(table_dates, dtype=object), table_lengths)
+    
+    options_chain = pd.DataFrame(columns, columns=OPTIONS_CHAIN_COLUMNS).astype(OPTIONS_CHAIN_DTYPES)
+    options_chain.sort_values('contract_id', kind='mergesort', ignore_index=True, inplace=True)
+    
+    return options_chain
+
+def _to_numeric(values: pa.ChunkedArray, numeric_type: pa.DataType) -> pa.ChunkedArray:
+    """
+    Cast a string column to a numeric type in bulk, turning values that are not
+    valid numbers of that type into nulls instead of failing the whole cast.
+    """
+    if pa.types.is_integer(numeric_type):
+        pattern = r'^-?[0-9]+$'
+    else:
+        pattern = r'^-?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?$'
+    is_number = pc.match_substring_regex(values, pattern)
+    return pc.cast(pc.if_else(is_number, values, pa.scalar(None, pa.string())), numeric_type)
+
+def _alphavantage_contracts_table(options_data: list) -> pa.Table:
+    """
+    Convert Alpha Vantage contracts into an Arrow table with the string columns
+    of ALPHAVANTAGE_CONTRACT_SCHEMA, with nulls for missing fields.
+    
+    Alpha Vantage sends every field as a string, which converts in one pass.
+    If any contract sends a field as another JSON type instead, the fields are
+    converted to strings one by one so that contract doesn't fail the others.
+    """
+    try:
+        return pa.Table.from_pylist(options_data, schema=ALPHAVANTAGE_CONTRACT_SCHEMA)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        pass
+    contracts = [c for c in options_data if isinstance(c, dict)]
+    return pa.table({
+        field.name: pa.array(
+            [None if c.get(field.name) is None else str(c[field.name]) for c in contracts],
+            type=pa.string()
+        )
+        for field in ALPHAVANTAGE_CONTRACT_SCHEMA
+    })
 
 def get_options_chain_from_alphavantage(exchange: str, ticker: str) -> pd.DataFrame:
     """
@@ -154,7 +315,7 @@ def get_options_chain_from_alphavantage(exchange: str, ticker: str) -> pd.DataFr
         ticker (str): Exchange ticker symbol of the underlying asset
         
     Returns:
-        pd.DataFrame: DataFrame containing options data with columns:
+        pd.DataFrame: DataFrame sorted by contract_id containing options data with columns:
             - contract_id: str, unique identifier for the option contract
             - type: str, option type ('call' or 'put')
             - strike: float, strike price of the contract
@@ -168,82 +329,103 @@ def get_options_chain_from_alphavantage(exchange: str, ticker: str) -> pd.DataFr
     Raises:
         ValueError: If API call fails or returns invalid data
     """
+    # Construct the API request parameters
+    api_key = os.environ.get('ALPHAVANTAGE_API_KEY')
+    params = {
+        'function': 'HISTORICAL_OPTIONS',
+        'symbol': ticker,
+        'apikey': api_key
+    }
+    
+    # Make API request
     try:
-        # Construct the API URL
-        api_key =os.environ.get('ALPHAVANTAGE_API_KEY')
-        base_url = "https://www.alphavantage.co/query?function="
-        function_param = "HISTORICAL_OPTIONS"
-        ticker_param = ticker
-        api_key_param = api_key
-        request_url = base_url + function_param + "&symbol=" + ticker_param + '&apikey=' + api_key_param
-        
-        # Make API request
-        response = requests.get(request_url)
+        response = _SESSION.get(ALPHAVANTAGE_URL, params=params, timeout=ALPHAVANTAGE_REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        
-        # Check for error messages
-        if "Error Message" in data:
-            raise ValueError(f"API Error: {data['Error Message']}")
-            
-        if not data:
-            raise ValueError(f"No options data available for {ticker}")
-
-        # Get the options data
-        options_data = data.get('data', [])
-        
-        # Initialize list to store processed options data
-        all_options = []
-        
-        # Process each option contract
-        for contract in options_data:
-            try:                
-                # Create standardized contract data
-                option_data = {
-                    'contract_id': contract['contractID'],
-                    'type': contract['type'],
-                    'strike': float(contract['strike']),
-                    'expiration': contract['expiration'],
-                    'volume': int(contract.get('volume', 0)),
-                    'open_interest': int(contract.get('open_interest', 0)),
-                    'implied_volatility': float(contract.get('implied_volatility', 0.0)),
-                    'bid': float(contract.get('bid', 0.0)),
-                    'ask': float(contract.get('ask', 0.0))
-                }
-                all_options.append(option_data)
-            except (KeyError, ValueError, TypeError) as e:
-                # Skip contracts with missing or invalid data
-                continue
-        
-        if not all_options:
-            raise ValueError(f"No valid options data found for {ticker}")
-        
-        # Convert to DataFrame
-        options_chain = pd.DataFrame(all_options)
-        
-        # Ensure columns are in the correct order
-        column_order = ['contract_id', 'type', 'strike', 'expiration', 'volume', 
-                       'open_interest', 'implied_volatility', 'bid', 'ask']
-        options_chain = options_chain[column_order]
-        
-        return options_chain
-        
     except requests.exceptions.RequestException as e:
         raise ValueError(f"API request failed: {str(e)}")
-    except (KeyError, ValueError) as e:
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Error processing API response: {str(e)}")
-    except Exception as e:
-        raise ValueError(f"Unexpected error: {str(e)}")
+    if not isinstance(data, dict):
+        raise ValueError(f"Error processing API response: expected a JSON object, got {type(data).__name__}")
+    
+    # Check for error messages
+    if "Error Message" in data:
+        raise ValueError(f"API Error: {data['Error Message']}")
+        
+    if not data:
+        raise ValueError(f"No options data available for {ticker}")
+
+    # Get the options data
+    options_data = data.get('data', [])
+    
+    # Convert the contracts into an Arrow table of string columns
+    table = _alphavantage_contracts_table(options_data)
+    
+    # Parse the numeric fields, turning unparseable values into nulls
+    strike = _to_numeric(table['strike'], pa.float64())
+    
+    # Skip contracts missing any of the fields that identify them
+    valid = strike.is_valid()
+    for key in ('contractID', 'type', 'expiration'):
+        valid = pc.and_(valid, table[key].is_valid())
+    table = table.filter(valid)
+    strike = strike.filter(valid)
+    
+    if table.num_rows == 0:
+        raise ValueError(f"No valid options data found for {ticker}")
+    
+    # Default missing or invalid optional values to zero
+    options_table = pa.table({
+        'contract_id': table['contractID'],
+        'type': table['type'],
+        'strike': strike,
+        'expiration': table['expiration'],
+        'volume': pc.fill_null(_to_numeric(table['volume'], pa.int64()), 0),
+        'open_interest': pc.fill_null(_to_numeric(table['open_interest'], pa.int64()), 0),
+        'implied_volatility': pc.fill_null(_to_numeric(table['implied_volatility'], pa.float64()), 0.0),
+        'bid': pc.fill_null(_to_numeric(table['bid'], pa.float64()), 0.0),
+        'ask': pc.fill_null(_to_numeric(table['ask'], pa.float64()), 0.0)
+    })
+    options_chain = options_table.to_pandas(
+        types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get
+    ).astype(OPTIONS_CHAIN_DTYPES)
+    options_chain.sort_values('contract_id', kind='mergesort', ignore_index=True, inplace=True)
+    
+    return options_chain
+
+def _options_chain_result(future, source: str) -> pd.DataFrame:
+    """
+    Get the options chain returned by a data source fetch running in the background.
+    
+    Args:
+        future (Future): Future of a get_options_chain_from_* call
+        source (str): Name of the data source, used in the warning message
+        
+    Returns:
+        pd.DataFrame: The fetched options chain, or an empty DataFrame with the
+                      options chain columns if the fetch failed
+    """
+    try:
+        return future.result()
+    except (ValueError, *YFINANCE_ERRORS) as e:
+        warnings.warn(f"Skipping {source} options data: {str(e)}")
+        return pd.DataFrame(columns=OPTIONS_CHAIN_COLUMNS).astype(
+            {**OPTIONS_CHAIN_NUMERIC_DTYPES, **OPTIONS_CHAIN_DTYPES}
+        )
 
-def get_and_save_aggregate_options_chain(exchange: str, ticker: str, output_dir: str = ".") -> pd.DataFrame:
+def get_and_save_aggregate_options_chain(exchange: str, ticker: str, output_dir: str = ".",
+                                         dedup: bool = False) -> pd.DataFrame:
     """
     Get options chain data from both yfinance and Alpha Vantage, combine them,
-    and save the result as a CSV file.
+    and save the result as a Parquet file.
     
     Args:
         exchange (str): Exchange where the underlying asset is traded
         ticker (str): Exchange ticker symbol of the underlying asset
-        output_dir (str): Directory where the CSV file will be saved (default: current directory)
+        output_dir (str): Directory where the Parquet file will be saved (default: current directory)
+        dedup (bool): Keep only one row per contract_id, preferring yfinance data (default: False)
         
     Returns:
         pd.DataFrame: Combined DataFrame containing options data from both sources,
@@ -255,44 +437,53 @@ def get_and_save_aggregate_options_chain(exchange: str, ticker: str, output_dir:
                      - ask
         
     Raises:
-        ValueError: If there's an error fetching data from either source
+        ValueError: If no data could be fetched from either source
     """
-    try:
-        # Get current timestamp for filename
-        current_time = datetime.now()
-        date_str = current_time.strftime("%Y-%m-%d")
-        time_str = current_time.strftime("%H-%M-%S")
-        
-        # Get data from both sources
-        yf_data = get_options_chain_from_yfinance(exchange, ticker)
-        av_data = get_options_chain_from_alphavantage(exchange, ticker)
-        
-        # Add source column to identify where each row came from
-        yf_data['source'] = 'yfinance'
-        av_data['source'] = 'alphavantage'
-        
-        # Combine the data
-        aggregate_data = pd.concat([yf_data, av_data], ignore_index=True)
-        
-        # Format decimal columns to two decimal places
-        decimal_columns = ['strike', 'implied_volatility', 'bid', 'ask']
-        for col in decimal_columns:
-            aggregate_data[col] = aggregate_data[col].round(2)
-        
-        # Sort by contract_id
-        aggregate_data.sort_values('contract_id', ascending=True, inplace=True)
-        
-        # Create filename using the specified convention
-        filename = f"{exchange}_{ticker}_options_chain_{date_str}_as_of_{time_str}.csv"
-        filepath = os.path.join(output_dir, filename)
-        
-        # Save to CSV, ensuring decimal places are preserved
-        aggregate_data.to_csv(filepath, index=False, float_format='%.2f')
-        
-        return aggregate_data
-        
-    except Exception as e:
-        raise ValueError(f"Error combining options chain data: {str(e)}")
+    # Get current timestamp for filename
+    timestamp = datetime.now().strftime("%Y-%m-%d_as_of_%H-%M-%S")
+    
+    # Get data from both sources concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yf_future = executor.submit(get_options_chain_from_yfinance, exchange, ticker)
+        av_future = executor.submit(get_options_chain_from_alphavantage, exchange, ticker)
+        yf_data = _options_chain_result(yf_future, 'yfinance')
+        av_data = _options_chain_result(av_future, 'Alpha Vantage')
+    
+    if yf_data.empty and av_data.empty:
+        raise ValueError(f"No options data available for {ticker} from any source")
+    
+    # Add source column to identify where each row came from; both frames
+    # share the same categories so concat keeps the column categorical
+    yf_data['source'] = pd.Categorical.from_codes(np.zeros(len(yf_data), dtype=np.int8), dtype=SOURCE_DTYPE)
+    av_data['source'] = pd.Categorical.from_codes(np.ones(len(av_data), dtype=np.int8), dtype=SOURCE_DTYPE)
+    
+    # Combine the data
+    aggregate_data = pd.concat([yf_data, av_data], ignore_index=True)
+    
+    # Format decimal columns to two decimal places
+    decimal_columns = ['strike', 'implied_volatility', 'bid', 'ask']
+    aggregate_data[decimal_columns] = aggregate_data[decimal_columns].round(2)
+    
+    # Sort by contract_id; each source is already sorted, so a stable sort
+    # only has to merge the two runs
+    aggregate_data.sort_values('contract_id', ascending=True, kind='mergesort', inplace=True)
+    
+    if dedup:
+        # Rows of a contract are adjacent after the sort, so keep each row
+        # whose contract_id differs from the previous one
+        contract_ids = pa.array(aggregate_data['contract_id'])
+        is_new = pc.not_equal(contract_ids.slice(1), contract_ids.slice(0, len(contract_ids) - 1))
+        keep = np.concatenate(([True], np.asarray(pc.fill_null(is_new, True))))
+        aggregate_data = aggregate_data[keep]
+    
+    # Create filename using the specified convention
+    filename = f"{exchange}_{ticker}_options_chain_{timestamp}.parquet"
+    filepath = os.path.join(output_dir, filename)
+    
+    # Save to Parquet, which preserves the column dtypes
+    aggregate_data.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+    
+    return aggregate_data
 
 def get_and_save_earliest_expiring_contracts(options_chain_df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -305,18 +496,26 @@ def get_and_save_earliest_expiring_contracts(options_chain_df: pd.DataFrame) ->
     Returns:
         pd.DataFrame: A DataFrame containing only the options contracts with the earliest expiration date.
                       If the input DataFrame is empty, returns an empty DataFrame.
+
+    Raises:
+        ValueError: If every contract in the DataFrame has already expired.
     """
 
     if options_chain_df.empty:
         return pd.DataFrame()
 
-    current_time = datetime.now()
-    current_date_str = current_time.strftime("%Y-%m-%d")
-    earliest_expiration = min(options_chain_df[options_chain_df['expiration'] >= current_date_str]['expiration'])
-    earliest_expiring_contracts = options_chain_df[options_chain_df['expiration'] == earliest_expiration]
+    current_date_str = date.today().isoformat()
+    # Scan the expiration column once to find the earliest unexpired date
+    expirations = options_chain_df['expiration'].to_numpy()
+    unexpired = expirations[expirations >= current_date_str]
+    if unexpired.size == 0:
+        raise ValueError(f"No contracts expire on or after {current_date_str}")
+    earliest_expiration = unexpired.min()
+    earliest_expiring_contracts = options_chain_df.iloc[np.flatnonzero(expirations == earliest_expiration)]
     
-    # Save to CSV
-    earliest_expiring_contracts.to_csv('earliest_expiring_contracts.csv', index=False)
+    # Save to Parquet
+    earliest_expiring_contracts.to_parquet('earliest_expiring_contracts.parquet', engine='pyarrow',
+                                           compression='zstd', index=False)
 
     return earliest_expiring_contracts
 
@@ -335,34 +534,58 @@ def get_most_recent_equity_price(equity_exchange: str, equity_ticker: str) -> fl
         ValueError: If the ticker is not found or if there's an error fetching data.
 
     """
+    stock = _ticker(equity_ticker)
     try:
-        stock = yf.Ticker(equity_ticker)
         data = stock.history(period="1d")
-        if data.empty:
-            raise ValueError(f"No data found for {equity_ticker}")
-        return float(data['Close'][0].round(6))
-    except Exception as e:
+    except YFINANCE_ERRORS as e:
         raise ValueError(f"Error fetching equity price: {str(e)}")
+    if data.empty:
+        raise ValueError(f"No data found for {equity_ticker}")
+    return float(data['Close'][0].round(6))
 
 def get_equity_price_history(equity_exchange: str, equity_ticker: str, period='max') -> pd.DataFrame:
-    stock = yf.Ticker(equity_ticker)
+    stock = _ticker(equity_ticker)
     price_history = stock.history(period=period)
     return price_history
 
+@njit(cache=True, error_model='numpy')
+def _price_differences(prices: np.ndarray):
+    """
+    Compute the day-to-day absolute and percentage differences of each price
+    column, the open to close difference and the high to low difference of an
+    (n, 4) array of Open, Close, Low and High prices in a single pass.
+    """
+    n, m = prices.shape
+    dtd_abs_diff = np.empty((n, m))
+    dtd_pct_diff = np.empty((n, m))
+    open_to_close = np.empty(n)
+    high_to_low = np.empty(n)
+    for i in range(n):
+        for j in range(m):
+            if i == 0:
+                # The first day has no previous day to compare against
+                dtd_abs_diff[i, j] = np.nan
+                dtd_pct_diff[i, j] = np.nan
+            else:
+                diff = prices[i, j] - prices[i - 1, j]
+                dtd_abs_diff[i, j] = diff
+                dtd_pct_diff[i, j] = diff / prices[i - 1, j] * 100
+        open_to_close[i] = prices[i, 1] - prices[i, 0]
+        high_to_low[i] = prices[i, 3] - prices[i, 2]
+    return dtd_abs_diff, dtd_pct_diff, open_to_close, high_to_low
+
 def calculate_price_differences(price_df: pd.DataFrame) -> pd.DataFrame:
     # The following values, unless otherwise written can be negative, positive
     # or negative
-    price_df['open_price_dtd_abs_diff'] = price_df['Open'].diff().abs()
-    price_df['open_price_dtd_pct_diff'] = (price_df['Open'].diff() / price_df['Open'].shift()) * 100
-    price_df['close_price_dtd_abs_diff'] = price_df['Close'].diff()
-    price_df['close_price_dtd_pct_diff'] = (price_df['Close'].diff() / price_df['Close'].shift()) * 100
-    price_df['low_price_dtd_abs_diff'] = price_df['Low'].diff()
-    price_df['low_price_dtd_pct_diff'] = (price_df['Low'].diff() / price_df['Low'].shift()) * 100
-    price_df['high_price_dtd_abs_diff'] = price_df['High'].diff()
-    price_df['high_price_dtd_pct_diff'] = (price_df['High'].diff() / price_df['High'].shift()) * 100
-    price_df['open_to_close_abs_diff'] = price_df['Close'] - price_df['Open']
+    price_columns = ['Open', 'Close', 'Low', 'High']
+    prices = np.ascontiguousarray(price_df[price_columns].to_numpy(dtype=np.float64))
+    dtd_abs_diff, dtd_pct_diff, open_to_close, high_to_low = _price_differences(prices)
+    for i, column in enumerate(price_columns):
+        price_df[f'{column.lower()}_price_dtd_abs_diff'] = dtd_abs_diff[:, i]
+        price_df[f'{column.lower()}_price_dtd_pct_diff'] = dtd_pct_diff[:, i]
+    price_df['open_to_close_abs_diff'] = open_to_close
     # The following value is always positive
-    price_df['high_to_low_abs_diff'] = price_df['High'] - price_df['Low']
+    price_df['high_to_low_abs_diff'] = high_to_low
     return price_df
 
 def calculate_price_volatility(price_df: pd.DataFrame, price_type: str, time_period: str) -> pd.DataFrame():
@@ -384,7 +607,7 @@ def calculate_price_volatility(price_df: pd.DataFrame, price_type: str, time_per
     return price_df
 
 def see_data_structure(equity_exchange: str, equity_ticker: str) -> None:
-    stock = yf.Ticker(equity_ticker)
+    stock = _ticker(equity_ticker)
     # print(sorted(stock.info.keys()))
     # print(stock.info['volume'])
     # print(stock.history(period='5d'))  # returns object of type pd.DatFrame